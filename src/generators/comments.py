@@ -11,14 +11,12 @@ Creates realistic comments/stories on tasks:
 import uuid
 import random
 from datetime import datetime, timedelta
+from itertools import accumulate
 from typing import Dict, Any, List
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from utils.dates import format_timestamp, random_date_between
-from utils.distributions import comment_count_for_task
+from utils.dates import format_timestamp
+from utils.distributions import comment_counts_for_tasks
+from utils.ids import batch_uuids
 
 
 # Comment templates by type
@@ -88,20 +86,36 @@ COMMENT_TEMPLATES = {
 }
 
 
+# Flattened comment-type lookup built once at import: tuple of type
+# indices with precomputed cumulative weights (status updates most
+# common), so draws bisect a fixed table instead of rebuilding the key
+# list and renormalizing weights
+_TEMPLATES_BY_IDX = tuple(tuple(v) for v in COMMENT_TEMPLATES.values())
+_TEMPLATE_COUNTS = tuple(len(t) for t in _TEMPLATES_BY_IDX)
+_TYPE_INDICES = range(len(_TEMPLATES_BY_IDX))
+_TYPE_CUM_WEIGHTS = tuple(accumulate((0.35, 0.20, 0.10, 0.15, 0.15, 0.05)))
+
+
+# Column order for the positional tuples produced by generate_comment,
+# matching Database.insert_many_tuples
+COMMENT_COLUMNS = ("id", "task_id", "author_id", "text", "created_at")
+
+
 def generate_comment(
     task_id: str,
     author_id: str,
     text: str,
-    created_at: datetime
-) -> Dict[str, Any]:
-    """Generate a single comment record."""
-    return {
-        "id": str(uuid.uuid4()),
-        "task_id": task_id,
-        "author_id": author_id,
-        "text": text,
-        "created_at": format_timestamp(created_at),
-    }
+    created_at: datetime,
+    comment_id: str = None
+) -> tuple:
+    """Generate a single comment record as a COMMENT_COLUMNS tuple."""
+    return (
+        comment_id if comment_id is not None else str(uuid.uuid4()),
+        task_id,
+        author_id,
+        text,
+        format_timestamp(created_at),
+    )
 
 
 def generate_comments(
@@ -109,7 +123,7 @@ def generate_comments(
     team_memberships: List[Dict[str, Any]],
     users: List[Dict[str, Any]],
     simulation_end: datetime = None
-) -> List[Dict[str, Any]]:
+) -> List[tuple]:
     """
     Generate comments for all tasks.
     
@@ -120,40 +134,30 @@ def generate_comments(
         simulation_end: End of simulation
     
     Returns:
-        List of comment records
+        List of comment tuples in COMMENT_COLUMNS order
     """
     if simulation_end is None:
         simulation_end = datetime.now()
     
     comments = []
-    
-    # Build team member lookup
-    team_members = {}
-    for mem in team_memberships:
-        tid = mem["team_id"]
-        if tid not in team_members:
-            team_members[tid] = []
-        team_members[tid].append(mem["user_id"])
-    
-    # Project to team lookup (we need this from projects data)
-    # For simplicity, we'll use task assignee/creator as potential commenters
-    
-    active_user_ids = [u["id"] for u in users if u["is_active"]]
-    
-    for task in tasks:
-        # Determine number of comments
-        num_comments = comment_count_for_task()
-        
+
+    # Commenters are drawn from the task assignee/creator plus random
+    # active users (team rosters aren't needed here)
+    active_user_ids = tuple(u["id"] for u in users if u["is_active"])
+
+    # Pre-draw comment counts in one batch so all ids can be minted from
+    # one os.urandom read instead of a syscall per uuid4()
+    comment_counts = comment_counts_for_tasks(len(tasks))
+    comment_ids = iter(batch_uuids(sum(comment_counts)))
+
+    for task, num_comments in zip(tasks, comment_counts):
         if num_comments == 0:
             continue
         
-        # Parse task dates
-        task_created = datetime.strptime(task["created_at"], "%Y-%m-%d %H:%M:%S")
-        
-        if task["completed_at"]:
-            task_end = datetime.strptime(task["completed_at"], "%Y-%m-%d %H:%M:%S")
-        else:
-            task_end = simulation_end
+        # Task times come through as raw datetimes on the record, so no
+        # string parsing is needed here
+        task_created = task["_created_at_dt"]
+        task_end = task["_completed_at_dt"] or simulation_end
         
         # Potential commenters (prioritize assignee and creator)
         potential_authors = []
@@ -162,22 +166,31 @@ def generate_comments(
         if task["created_by_id"]:
             potential_authors.append(task["created_by_id"])
         
-        # Add some random team members
-        potential_authors.extend(random.sample(
-            active_user_ids,
-            k=min(5, len(active_user_ids))
-        ))
+        # Add some random team members; duplicates across (or within) a
+        # task's author pool are harmless, so skip random.sample's
+        # without-replacement bookkeeping. random.choices raises on an
+        # empty population, so skip it when no users are active
+        if active_user_ids:
+            potential_authors.extend(random.choices(active_user_ids, k=5))
         
+        # One window computation per task; per-comment times are drawn
+        # as plain arithmetic offsets below instead of re-deriving the
+        # window inside random_date_between for every comment
+        window_secs = (task_end - task_created).total_seconds()
+
+        # Draw all comment types for this task at once against the
+        # precomputed cumulative weights
+        type_idxs = random.choices(
+            _TYPE_INDICES,
+            cum_weights=_TYPE_CUM_WEIGHTS,
+            k=num_comments
+        )
+
         # Generate comments
-        for i in range(num_comments):
-            # Pick comment type (status updates more common)
-            comment_type = random.choices(
-                list(COMMENT_TEMPLATES.keys()),
-                weights=[0.35, 0.20, 0.10, 0.15, 0.15, 0.05],
-                k=1
-            )[0]
-            
-            text = random.choice(COMMENT_TEMPLATES[comment_type])
+        for i, type_idx in enumerate(type_idxs):
+            # Index directly with a pre-cached length: random.choice
+            # would re-derive len() and bounds-check via __getitem__
+            text = _TEMPLATES_BY_IDX[type_idx][random.randrange(_TEMPLATE_COUNTS[type_idx])]
             
             # Pick author (weight toward assignee)
             if potential_authors:
@@ -191,16 +204,15 @@ def generate_comments(
             # Comment time (distributed between task creation and end)
             # Earlier comments more likely
             progress = (i + 1) / (num_comments + 1)
-            comment_window_start = task_created
-            comment_window_end = task_created + (task_end - task_created) * min(1.0, progress + 0.2)
-            
-            created_at = random_date_between(comment_window_start, comment_window_end)
+            max_offset = window_secs * min(1.0, progress + 0.2)
+            created_at = task_created + timedelta(seconds=random.random() * max_offset)
             
             comment = generate_comment(
                 task_id=task["id"],
                 author_id=author_id,
                 text=text,
-                created_at=created_at
+                created_at=created_at,
+                comment_id=next(comment_ids)
             )
             comments.append(comment)
     
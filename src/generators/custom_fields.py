@@ -12,13 +12,13 @@ Creates custom field definitions and values:
 import uuid
 import random
 import json
+from collections import namedtuple
+from itertools import count
 from typing import Dict, Any, List
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.alias import Alias
+from utils.distributions import binomialvariate
 
-from utils.distributions import weighted_choice
 
 
 # Standard custom field definitions
@@ -79,6 +79,27 @@ FIELD_DEFINITIONS = [
 ]
 
 
+# Flat per-field struct for the value-generation hot loop: attribute
+# access on a namedtuple instead of dict lookups and field_type string
+# compares per field x task
+_FieldDef = namedtuple("_FieldDef", ("id", "is_number", "alias", "is_sprint"))
+
+
+# Alias samplers built once per distribution table, keyed by the
+# table's contents: identity keys would hand stale samplers to
+# caller-built dicts that reuse a freed address
+_ALIAS_CACHE: Dict[tuple, Alias] = {}
+
+
+def _alias_for(distribution: Dict[Any, float]) -> Alias:
+    """Get (or build) the alias sampler for a distribution dict."""
+    key = tuple(distribution.items())
+    sampler = _ALIAS_CACHE.get(key)
+    if sampler is None:
+        sampler = _ALIAS_CACHE[key] = Alias(distribution)
+    return sampler
+
+
 def generate_custom_field_definition(
     name: str,
     field_type: str,
@@ -116,11 +137,15 @@ def generate_custom_field_definitions(organization_id: str) -> List[Dict[str, An
 def generate_custom_field_value(
     field_id: str,
     task_id: str,
-    value: str
+    value: str,
+    value_id: int = None
 ) -> Dict[str, Any]:
-    """Generate a custom field value record."""
+    """Generate a custom field value record.
+
+    Value ids are sequential integers (rowid aliases in SQLite);
+    passing None lets the database assign one on insert."""
     return {
-        "id": str(uuid.uuid4()),
+        "id": value_id,
         "field_id": field_id,
         "task_id": task_id,
         "value": value,
@@ -144,42 +169,52 @@ def generate_custom_field_values(
         List of custom field value records
     """
     values = []
-    
+    value_ids = count(1)
+
     # Only parent tasks get custom fields (not subtasks)
     parent_tasks = [t for t in tasks if t.get("parent_task_id") is None]
-    
-    for field_def in field_definitions:
-        distribution = field_def.get("_distribution")
-        field_type = field_def["field_type"]
-        
-        for task in parent_tasks:
-            # Skip some tasks randomly
-            if random.random() > coverage_rate:
-                continue
-            
-            # Generate value based on field type
-            if field_type == "enum" and distribution:
-                value = weighted_choice(distribution)
-            elif field_type == "number" and distribution:
-                value = str(weighted_choice(distribution))
-            elif field_type == "text":
-                # Sprint field - generate sprint name
-                # Parse task creation date for sprint calculation
-                # Simple approach: Sprint N based on week number
-                if field_def["name"] == "Sprint":
-                    sprint_num = random.randint(1, 26)  # ~6 months of sprints
-                    value = f"Sprint {sprint_num}"
-                else:
-                    value = None
-            else:
-                value = None
-            
-            if value:
-                field_value = generate_custom_field_value(
-                    field_id=field_def["id"],
-                    task_id=task["id"],
-                    value=value
-                )
-                values.append(field_value)
-    
+
+    # Resolve each definition dict into a flat struct once, so the hot
+    # loop below works with attribute loads and a prebound sampler
+    # instead of repeated key lookups and string compares
+    field_defs = [
+        _FieldDef(
+            id=fd["id"],
+            is_number=fd["field_type"] == "number",
+            alias=_alias_for(fd["_distribution"]) if fd.get("_distribution") else None,
+            is_sprint=fd["field_type"] == "text" and fd["name"] == "Sprint",
+        )
+        for fd in field_definitions
+    ]
+
+    for field_def in field_defs:
+        # Tasks covered by this field: draw the coverage count once and
+        # sample that many tasks, instead of a Bernoulli gate per task
+        n_keep = binomialvariate(len(parent_tasks), coverage_rate)
+        covered = random.sample(parent_tasks, n_keep)
+
+        # Draw all values for this field via its cached alias sampler:
+        # O(1) per draw regardless of the number of options
+        if field_def.alias is not None:
+            field_values = field_def.alias.sample_k(len(covered))
+            if field_def.is_number:
+                field_values = [str(v) for v in field_values]
+        elif field_def.is_sprint:
+            # Sprint field - generate sprint names (~6 months of sprints)
+            field_values = [
+                f"Sprint {n}" for n in random.choices(range(1, 27), k=len(covered))
+            ]
+        else:
+            continue
+
+        values.extend(
+            generate_custom_field_value(
+                field_id=field_def.id,
+                task_id=task["id"],
+                value=value,
+                value_id=next(value_ids)
+            )
+            for task, value in zip(covered, field_values)
+        )
+
     return values
@@ -9,10 +9,6 @@ import uuid
 from datetime import datetime
 from typing import Dict, Any
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.dates import format_timestamp
 
 
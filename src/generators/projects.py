@@ -8,17 +8,19 @@ Creates realistic projects with:
 - Status distribution: active (60%), paused (10%), completed (30%)
 """
 
+import sys
+import re
 import uuid
 import random
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from utils.dates import format_timestamp, random_date_between, format_date
+from utils.dates import format_timestamp, format_date
 from utils.distributions import weighted_choice, biased_boolean
+from utils.ids import uuid_stream
 
 
 # Project name templates by department
@@ -76,17 +78,52 @@ COMPONENTS = ["Auth", "Billing", "Notifications", "Search", "Analytics", "Core"]
 EVENTS = ["Summit", "Conference", "Webinar", "Launch", "Workshop"]
 
 
+# Matches {placeholder} tokens for single-pass substitution
+_PLACE_RE = re.compile(r"\{(\w+)\}")
+
+@lru_cache(maxsize=32)
+def _quarter_ends(year: int) -> tuple:
+    """Quarter-end dates for a year, built once per year."""
+    return (
+        datetime(year, 3, 31),
+        datetime(year, 6, 30),
+        datetime(year, 9, 30),
+        datetime(year, 12, 31),
+    )
+
+
+# Status draw tables: cumulative weights precomputed once so each draw
+# is a bisect over three floats instead of a random.choices setup
+_STATUSES = ("active", "paused", "completed")
+_CW_OLD = (0.20, 0.30, 1.00)   # older projects skew completed
+_CW_NEW = (0.70, 0.80, 1.00)
+
+
 def _fill_template(template: str, quarter: int, year: int) -> str:
-    """Fill in template placeholders."""
-    result = template
-    result = result.replace("{quarter}", str(quarter))
-    result = result.replace("{year}", str(year))
-    result = result.replace("{version}", str(random.randint(2, 5)))
-    result = result.replace("{feature}", random.choice(FEATURES))
-    result = result.replace("{area}", random.choice(AREAS))
-    result = result.replace("{component}", random.choice(COMPONENTS))
-    result = result.replace("{event}", random.choice(EVENTS))
-    return result
+    """Fill in template placeholders in one regex pass."""
+    if "{" not in template:
+        return template
+    subs = {
+        "quarter": str(quarter),
+        "year": str(year),
+        "version": str(random.randint(2, 5)),
+        "feature": random.choice(FEATURES),
+        "area": random.choice(AREAS),
+        "component": random.choice(COMPONENTS),
+        "event": random.choice(EVENTS),
+    }
+    return _PLACE_RE.sub(lambda m: subs[m.group(1)], template)
+
+
+# Description tails, interned once so the repeated sentences share
+# storage across every project record
+_DESC_TAILS = tuple(sys.intern(s) for s in (
+    "Key initiative for this quarter.",
+    "Cross-functional collaboration required.",
+    "High priority for leadership.",
+    "Part of our strategic roadmap.",
+    "Customer-facing improvements.",
+))
 
 
 def generate_project(
@@ -96,21 +133,15 @@ def generate_project(
     created_at: datetime,
     due_date: datetime = None,
     status: str = "active",
-    archived: bool = False
+    archived: bool = False,
+    project_id: str = None
 ) -> Dict[str, Any]:
     """Generate a single project record."""
     # Generate description based on name
-    description = f"Project focused on {name.lower()}. "
-    description += random.choice([
-        "Key initiative for this quarter.",
-        "Cross-functional collaboration required.",
-        "High priority for leadership.",
-        "Part of our strategic roadmap.",
-        "Customer-facing improvements.",
-    ])
-    
+    description = f"Project focused on {name.lower()}. {_DESC_TAILS[random.randrange(5)]}"
+
     return {
-        "id": str(uuid.uuid4()),
+        "id": project_id if project_id is not None else str(uuid.uuid4()),
         "name": name,
         "description": description,
         "team_id": team_id,
@@ -145,28 +176,33 @@ def generate_projects(
         List of project records
     """
     projects = []
-    used_names = set()
-    
-    # Build lookup for team leads
-    team_leads = {}
-    for team in teams:
-        leads = [
-            m["user_id"] for m in team_memberships
-            if m["team_id"] == team["id"] and m["role"] == "lead"
-        ]
-        if not leads:
-            # Fall back to any team member
-            leads = [m["user_id"] for m in team_memberships if m["team_id"] == team["id"]]
-        team_leads[team["id"]] = leads
+    name_counts = Counter()
+    rand = random.random
+
+    # Mint ids in chunked batches instead of one urandom read per record
+    project_ids = uuid_stream()
     
+    # Index memberships once instead of rescanning them per team
+    members_by_team = defaultdict(list)
+    leads_by_team = defaultdict(list)
+    for m in team_memberships:
+        tid = m["team_id"]
+        members_by_team[tid].append(m["user_id"])
+        if m["role"] == "lead":
+            leads_by_team[tid].append(m["user_id"])
+
+    # Team leads lookup (fall back to any team member)
+    team_leads = {
+        t["id"]: leads_by_team[t["id"]] or members_by_team[t["id"]]
+        for t in teams
+    }
+
     # Senior users for project ownership
     senior_user_ids = {u["id"] for u in users if u["role"] in ("senior", "lead") and u["is_active"]}
-    
+    senior_user_tuple = tuple(senior_user_ids)
+
     # Distribute projects among teams (weighted by team size)
-    team_sizes = {
-        t["id"]: len([m for m in team_memberships if m["team_id"] == t["id"]])
-        for t in teams
-    }
+    team_sizes = {t["id"]: len(members_by_team[t["id"]]) for t in teams}
     total_size = sum(team_sizes.values()) or 1
     
     for team in teams:
@@ -177,32 +213,36 @@ def generate_projects(
         team_weight = team_sizes[team["id"]] / total_size
         team_project_count = max(1, int(num_projects * team_weight))
         
-        team_created = datetime.strptime(team["created_at"], "%Y-%m-%d %H:%M:%S")
-        
+        team_created = datetime.fromisoformat(team["created_at"])
+
+        # Creation window is constant per team: compute the bounds once
+        # and draw each date as a plain arithmetic offset instead of
+        # re-deriving the window inside random_date_between per project
+        window_lo = max(team_created, simulation_start)
+        window_secs = max(
+            0.0, (simulation_end - timedelta(days=7) - window_lo).total_seconds()
+        )
+
         for _ in range(team_project_count):
             if len(projects) >= num_projects:
                 break
-            
+
             # Pick a template and generate name
             template = random.choice(templates)
-            
+
             # Determine quarter based on random date
-            created_at = random_date_between(
-                max(team_created, simulation_start),
-                simulation_end - timedelta(days=7)
-            )
+            created_at = window_lo + timedelta(seconds=rand() * window_secs)
             quarter = (created_at.month - 1) // 3 + 1
             year = created_at.year
             
             name = _fill_template(template, quarter, year)
             
-            # Ensure unique name
-            base_name = name
-            counter = 1
-            while name in used_names:
-                name = f"{base_name} ({counter})"
-                counter += 1
-            used_names.add(name)
+            # Ensure unique name: one counter bump per base name instead
+            # of probing a growing set of every name ever emitted
+            seen = name_counts[name]
+            name_counts[name] = seen + 1
+            if seen:
+                name = f"{name} ({seen})"
             
             # Select owner (prefer team leads, fall back to senior users)
             possible_owners = [
@@ -212,24 +252,22 @@ def generate_projects(
             if not possible_owners:
                 possible_owners = team_leads.get(team["id"], [])
             if not possible_owners:
-                possible_owners = list(senior_user_ids)
+                possible_owners = senior_user_tuple
             
             owner_id = random.choice(possible_owners) if possible_owners else users[0]["id"]
             
             # Determine due date (60% have dates, clustered on quarter ends)
             due_date = None
             if random.random() < 0.60:
-                # Quarter end dates
-                quarter_ends = [
-                    datetime(year, 3, 31),
-                    datetime(year, 6, 30),
-                    datetime(year, 9, 30),
-                    datetime(year, 12, 31),
+                # Pick a future quarter end (within 2 quarters); slicing
+                # from the current quarter skips the ends that are
+                # already past
+                future_ends = [
+                    d for d in _quarter_ends(year)[quarter - 1:quarter + 1]
+                    if d > created_at
                 ]
-                # Pick a future quarter end
-                future_ends = [d for d in quarter_ends if d > created_at]
                 if future_ends:
-                    due_date = random.choice(future_ends[:2])  # Within 2 quarters
+                    due_date = random.choice(future_ends)
                 else:
                     due_date = created_at + timedelta(days=random.randint(30, 90))
             
@@ -238,16 +276,10 @@ def generate_projects(
             
             if age_days > 180:  # Older than 6 months
                 archived = biased_boolean(0.30)  # 30% archived
-                status = random.choices(
-                    ["active", "paused", "completed"],
-                    weights=[0.20, 0.10, 0.70]  # Older projects more likely completed
-                )[0]
+                status = _STATUSES[bisect_right(_CW_OLD, random.random())]
             else:
                 archived = False
-                status = random.choices(
-                    ["active", "paused", "completed"],
-                    weights=[0.70, 0.10, 0.20]
-                )[0]
+                status = _STATUSES[bisect_right(_CW_NEW, random.random())]
             
             project = generate_project(
                 name=name,
@@ -256,7 +288,8 @@ def generate_projects(
                 created_at=created_at,
                 due_date=due_date,
                 status=status,
-                archived=archived
+                archived=archived,
+                project_id=next(project_ids)
             )
             project["department"] = dept  # Store for generating tasks
             projects.append(project)
@@ -7,12 +7,10 @@ Creates Kanban-style sections for projects:
 - Default: To Do, In Progress, Done
 """
 
-import uuid
-from typing import Dict, Any, List
-
 import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from collections import defaultdict
+from itertools import count
+from typing import Dict, Any, List
 
 
 # Section templates by project type/department
@@ -41,14 +39,27 @@ SECTION_TEMPLATES = {
 }
 
 
+# Section-name tuples with interned strings, built once at module load:
+# the thousands of repeated names across projects share storage and
+# compare by pointer in downstream dict/set lookups
+_SECTIONS_BY_DEPT = {
+    dept: tuple(sys.intern(n) for n in names)
+    for dept, names in SECTION_TEMPLATES.items()
+}
+
+
 def generate_section(
     name: str,
     project_id: str,
-    position: int
+    position: int,
+    section_id: int = None
 ) -> Dict[str, Any]:
-    """Generate a single section record."""
+    """Generate a single section record.
+
+    Section ids are sequential integers (rowid aliases in SQLite);
+    passing None lets the database assign one on insert."""
     return {
-        "id": str(uuid.uuid4()),
+        "id": section_id,
         "name": name,
         "project_id": project_id,
         "position": position,
@@ -65,36 +76,54 @@ def generate_sections(projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     Returns:
         List of section records
     """
-    sections = []
-    
-    for project in projects:
-        dept = project.get("department", "default")
-        section_names = SECTION_TEMPLATES.get(dept, SECTION_TEMPLATES["default"])
-        
-        for position, name in enumerate(section_names):
-            section = generate_section(
-                name=name,
-                project_id=project["id"],
-                position=position
-            )
-            sections.append(section)
-    
-    return sections
+    # Sequential ints: sections need no cross-system UUIDs, and an
+    # INTEGER PRIMARY KEY is a zero-storage rowid alias in SQLite
+    section_ids = count(1)
+
+    # Single comprehension constructing the records inline; the
+    # per-project template lookup happens once per project
+    return [
+        {
+            "id": next(section_ids),
+            "name": name,
+            "project_id": project["id"],
+            "position": position,
+        }
+        for project in projects
+        for position, name in enumerate(
+            _SECTIONS_BY_DEPT.get(project.get("department", "default"),
+                                  _SECTIONS_BY_DEPT["default"])
+        )
+    ]
+
+
+def build_section_index(sections: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Index sections by project_id, ordered by position.
+
+    Build this once and pass it to the lookup helpers below: each lookup
+    becomes an O(1) dict access instead of a scan over every section.
+    generate_sections already emits in position order per project, so no
+    per-project sort is needed.
+    """
+    index = defaultdict(list)
+    for s in sections:
+        index[s["project_id"]].append(s)
+    return index
 
 
-def get_sections_for_project(project_id: str, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def get_sections_for_project(project_id: str, section_index: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
     """Get all sections for a project, ordered by position."""
-    project_sections = [s for s in sections if s["project_id"] == project_id]
-    return sorted(project_sections, key=lambda s: s["position"])
+    return section_index.get(project_id, [])
 
 
-def get_done_section(project_id: str, sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+def get_done_section(project_id: str, section_index: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
     """Get the 'done' section for a project (last section)."""
-    project_sections = get_sections_for_project(project_id, sections)
+    project_sections = section_index.get(project_id)
     return project_sections[-1] if project_sections else None
 
 
-def get_backlog_section(project_id: str, sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+def get_backlog_section(project_id: str, section_index: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
     """Get the first section (backlog/to-do) for a project."""
-    project_sections = get_sections_for_project(project_id, sections)
+    project_sections = section_index.get(project_id)
     return project_sections[0] if project_sections else None
@@ -14,12 +14,9 @@ import random
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from utils.dates import format_timestamp, format_date, random_date_between
-from utils.distributions import subtask_count_for_task, biased_boolean
+from utils.dates import format_timestamp, format_date
+from utils.distributions import subtask_count_for_task
+from utils.ids import uuid_stream
 
 
 # Subtask name patterns (action-oriented, shorter than parent tasks)
@@ -46,6 +43,15 @@ SUBTASK_PATTERNS = [
     "Security review",
 ]
 
+# Substitutions for the {topic} placeholder
+TOPICS = ("options", "requirements", "alternatives", "dependencies")
+
+# Per-position completion probabilities, tabulated once: earlier
+# subtasks are more likely done. Sized past the max subtask count so
+# the hot loop is a plain tuple index with no float arithmetic.
+_P_DONE_PARENT_DONE = tuple(0.90 - i * 0.05 for i in range(16))
+_P_DONE_PARENT_OPEN = tuple(0.3 + i * 0.1 for i in range(16))
+
 
 def generate_subtask(
     parent_task: Dict[str, Any],
@@ -53,11 +59,12 @@ def generate_subtask(
     position: int,
     created_at: datetime,
     completed: bool,
-    completed_at: datetime = None
+    completed_at: datetime = None,
+    subtask_id: str = None
 ) -> Dict[str, Any]:
     """Generate a subtask record."""
     return {
-        "id": str(uuid.uuid4()),
+        "id": subtask_id if subtask_id is not None else str(uuid.uuid4()),
         "name": name,
         "description": None,  # Subtasks typically don't have descriptions
         "project_id": parent_task["project_id"],
@@ -70,6 +77,9 @@ def generate_subtask(
         "completed": 1 if completed else 0,
         "completed_at": format_timestamp(completed_at) if completed_at else None,
         "position": position,
+        # Raw datetimes for the comment generator; stripped before insert
+        "_created_at_dt": created_at,
+        "_completed_at_dt": completed_at,
     }
 
 
@@ -93,73 +103,67 @@ def generate_subtasks(
         simulation_end = datetime.now()
     
     subtasks = []
-    
+    subtask_ids = uuid_stream()
+
+    # Bind the RNG locally: the inner loop below draws several uniforms
+    # per subtask, and inlined `rand() < p` / offset arithmetic avoids a
+    # helper-function crossing for each one
+    rand = random.random
+
     # Only consider parent tasks (not already subtasks)
     parent_tasks = [t for t in tasks if t.get("parent_task_id") is None]
-    
+
     # Select tasks that will have subtasks
     tasks_with_subtasks = [
         t for t in parent_tasks
-        if biased_boolean(subtask_rate)
+        if rand() < subtask_rate
     ]
-    
+
     for parent in tasks_with_subtasks:
         # Determine number of subtasks
         num_subtasks = subtask_count_for_task()
         
-        # Parse parent creation time
-        parent_created = datetime.strptime(parent["created_at"], "%Y-%m-%d %H:%M:%S")
+        # Parent times come through as raw datetimes on the task record,
+        # so there is no string parsing at all on this path
+        parent_created = parent["_created_at_dt"]
         parent_completed = parent["completed"]
-        parent_completed_at = None
-        if parent["completed_at"]:
-            parent_completed_at = datetime.strptime(parent["completed_at"], "%Y-%m-%d %H:%M:%S")
-        
-        # Generate subtasks
-        used_names = set()
+        parent_completed_at = parent["_completed_at_dt"]
         
-        for i in range(num_subtasks):
-            # Pick a unique name
-            name = random.choice(SUBTASK_PATTERNS)
-            attempt = 0
-            while name in used_names and attempt < 10:
-                name = random.choice(SUBTASK_PATTERNS)
-                # Add variety
-                if "{topic}" in name:
-                    name = name.replace("{topic}", random.choice([
-                        "options", "requirements", "alternatives", "dependencies"
-                    ]))
-                attempt += 1
-            used_names.add(name)
-            
-            # Subtask creation is after parent, staggered
-            subtask_created = random_date_between(
-                parent_created,
-                parent_created + timedelta(days=2)
-            )
-            
+        # Sample unique names in one call instead of rejection-looping
+        chosen = random.sample(SUBTASK_PATTERNS, min(num_subtasks, len(SUBTASK_PATTERNS)))
+
+        for i, name in enumerate(chosen):
+            if "{topic}" in name:
+                name = name.replace("{topic}", random.choice(TOPICS))
+
+            # Subtask creation is after parent, staggered within 2 days
+            subtask_created = parent_created + timedelta(seconds=rand() * 172800)
+
             # Subtask completion follows parent
             if parent_completed:
                 # If parent is completed, most subtasks should be completed
                 # Earlier subtasks more likely completed
-                subtask_completed = biased_boolean(0.90 - (i * 0.05))
-                
+                subtask_completed = rand() < _P_DONE_PARENT_DONE[i]
+
                 if subtask_completed and parent_completed_at:
                     # Complete before parent
-                    subtask_completed_at = random_date_between(
-                        subtask_created,
-                        parent_completed_at
-                    )
+                    window = (parent_completed_at - subtask_created).total_seconds()
+                    if window > 0:
+                        subtask_completed_at = subtask_created + timedelta(seconds=rand() * window)
+                    else:
+                        subtask_completed_at = subtask_created
                 else:
                     subtask_completed_at = None
                     subtask_completed = False
             else:
                 # Parent not completed - some subtasks may be done
-                subtask_completed = biased_boolean(0.3 + (i * 0.1))  # Earlier more likely done
+                subtask_completed = rand() < _P_DONE_PARENT_OPEN[i]  # Earlier more likely done
                 if subtask_completed:
-                    subtask_completed_at = random_date_between(
-                        subtask_created,
-                        simulation_end
-                    )
+                    window = (simulation_end - subtask_created).total_seconds()
+                    if window > 0:
+                        subtask_completed_at = subtask_created + timedelta(seconds=rand() * window)
+                    else:
+                        subtask_completed_at = subtask_created
                 else:
                     subtask_completed_at = None
             
@@ -169,7 +173,8 @@ def generate_subtasks(
                 position=i,
                 created_at=subtask_created,
                 completed=subtask_completed,
-                completed_at=subtask_completed_at
+                completed_at=subtask_completed_at,
+                subtask_id=next(subtask_ids)
             )
             subtasks.append(subtask)
     
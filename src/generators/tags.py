@@ -5,16 +5,11 @@ Creates tags and task-tag associations.
 Tags are cross-project labels for categorization.
 """
 
+import re
 import uuid
 import random
 from typing import Dict, Any, List
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from utils.distributions import biased_boolean
-
 
 # Predefined tags with colors (Asana color palette)
 PREDEFINED_TAGS = [
@@ -41,6 +36,29 @@ PREDEFINED_TAGS = [
 ]
 
 
+# Keyword -> tag-name map for smart assignment, compiled into one
+# alternation so each task name is scanned once for every keyword
+# instead of once per substring test
+_KEYWORD_TO_TAG = {
+    "fix": "bug",
+    "bug": "bug",
+    "feature": "feature",
+    "implement": "feature",
+    "refactor": "tech-debt",
+    "document": "documentation",
+    "test": "testing",
+    "security": "security",
+    "performance": "performance",
+    "optimize": "performance",
+    "mobile": "mobile",
+    "api": "api",
+}
+# Case-insensitive so task names are scanned as-is, without paying a
+# str.lower() allocation per task; only the short matched keywords
+# (if any) get folded for the table lookup
+_KEYWORD_RE = re.compile("|".join(map(re.escape, _KEYWORD_TO_TAG)), re.IGNORECASE)
+
+
 def generate_tag(
     name: str,
     color: str,
@@ -70,91 +88,82 @@ def generate_tags(organization_id: str) -> List[Dict[str, Any]]:
     return tags
 
 
-def generate_task_tag(task_id: str, tag_id: str) -> Dict[str, Any]:
-    """Generate a task-tag association record."""
-    return {
-        "task_id": task_id,
-        "tag_id": tag_id,
-    }
+# Column order for the positional tuples produced by generate_task_tag,
+# matching Database.insert_many_tuples
+TASK_TAG_COLUMNS = ("task_id", "tag_id")
+
+
+def generate_task_tag(task_id: str, tag_id: str) -> tuple:
+    """Generate a task-tag association as a TASK_TAG_COLUMNS tuple."""
+    return (task_id, tag_id)
 
 
 def generate_task_tags(
     tasks: List[Dict[str, Any]],
     tags: List[Dict[str, Any]],
     tag_rate: float = 0.40
-) -> List[Dict[str, Any]]:
+) -> List[tuple]:
     """
     Generate task-tag associations.
-    
+
     Args:
         tasks: Task records
         tags: Tag records
         tag_rate: Percentage of tasks that have at least one tag
-    
+
     Returns:
-        List of task-tag association records
+        List of task-tag tuples in TASK_TAG_COLUMNS order
     """
     task_tags = []
-    
-    # Build tag lookup by name for smart assignment
-    tag_by_name = {t["name"]: t for t in tags}
-    
-    # Only parent tasks get tags (not subtasks)
-    parent_tasks = [t for t in tasks if t.get("parent_task_id") is None]
-    
+
+    # Each tag gets one bit of a small int, so a task's assigned-tag
+    # "set" is a mask built with integer ORs (dedup for free) instead
+    # of a per-task hash set
+    bit_by_name = {t["name"]: 1 << i for i, t in enumerate(tags)}
+    tag_id_by_bit = {1 << i: t["id"] for i, t in enumerate(tags)}
+    bit_by_keyword = {
+        kw: bit_by_name[name]
+        for kw, name in _KEYWORD_TO_TAG.items()
+        if name in bit_by_name
+    }
+
+    # Only parent tasks get tags (not subtasks). The pipeline already
+    # passes the parent-only list, so this is a cheap guard; every task
+    # record carries the key, so index instead of .get
+    parent_tasks = [t for t in tasks if t["parent_task_id"] is None]
+
+    # Bound RNG methods: one draw per task plus one per extra-tag gate
+    rand = random.random
+    choices = random.choices
+    randint = random.randint
+
+    # Tag bits in tag order, for drawing random extras directly as bits
+    tag_bits = tuple(tag_id_by_bit)
+
     for task in parent_tasks:
-        if not biased_boolean(tag_rate):
+        if rand() >= tag_rate:
             continue
-        
-        task_name_lower = task["name"].lower()
-        assigned_tags = set()
-        
-        # Smart tag assignment based on task name
-        if "fix" in task_name_lower or "bug" in task_name_lower:
-            if "bug" in tag_by_name:
-                assigned_tags.add(tag_by_name["bug"]["id"])
-        
-        if "feature" in task_name_lower or "implement" in task_name_lower:
-            if "feature" in tag_by_name:
-                assigned_tags.add(tag_by_name["feature"]["id"])
-        
-        if "refactor" in task_name_lower:
-            if "tech-debt" in tag_by_name:
-                assigned_tags.add(tag_by_name["tech-debt"]["id"])
-        
-        if "document" in task_name_lower:
-            if "documentation" in tag_by_name:
-                assigned_tags.add(tag_by_name["documentation"]["id"])
-        
-        if "test" in task_name_lower:
-            if "testing" in tag_by_name:
-                assigned_tags.add(tag_by_name["testing"]["id"])
-        
-        if "security" in task_name_lower:
-            if "security" in tag_by_name:
-                assigned_tags.add(tag_by_name["security"]["id"])
-        
-        if "performance" in task_name_lower or "optimize" in task_name_lower:
-            if "performance" in tag_by_name:
-                assigned_tags.add(tag_by_name["performance"]["id"])
-        
-        if "mobile" in task_name_lower:
-            if "mobile" in tag_by_name:
-                assigned_tags.add(tag_by_name["mobile"]["id"])
-        
-        if "api" in task_name_lower:
-            if "api" in tag_by_name:
-                assigned_tags.add(tag_by_name["api"]["id"])
-        
-        # Add 0-2 random additional tags
-        if random.random() < 0.3:
-            additional = random.sample(tags, k=min(len(tags), random.randint(1, 2)))
-            for tag in additional:
-                assigned_tags.add(tag["id"])
-        
-        # Create task-tag records
-        for tag_id in assigned_tags:
-            task_tag = generate_task_tag(task["id"], tag_id)
-            task_tags.append(task_tag)
+
+        mask = 0
+
+        # Smart tag assignment based on task name: one linear scan
+        # collects every keyword hit
+        for kw in _KEYWORD_RE.findall(task["name"]):
+            mask |= bit_by_keyword.get(kw.lower(), 0)
+
+        # Add 0-2 random additional tags, drawn with replacement straight
+        # as bits: the mask dedups, so random.sample's pool copy and
+        # without-replacement bookkeeping buy nothing here
+        if rand() < 0.3:
+            for b in choices(tag_bits, k=randint(1, 2)):
+                mask |= b
+
+        # Create task-tag records (flat tuples: no per-row dict
+        # overhead), peeling one set bit per row
+        task_id = task["id"]
+        while mask:
+            lsb = mask & -mask
+            mask ^= lsb
+            task_tags.append((task_id, tag_id_by_bit[lsb]))
     
     return task_tags
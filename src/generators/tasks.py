@@ -12,20 +12,17 @@ Creates realistic tasks with:
 import uuid
 import random
 from datetime import datetime, timedelta
+from itertools import accumulate, permutations
 from typing import Dict, Any, List, Optional
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.dates import (
     format_timestamp, format_date, random_business_date,
-    generate_due_date, generate_completion_time
+    generate_due_dates, generate_completion_time
 )
 from utils.distributions import (
-    weighted_choice, biased_boolean, completion_rate_for_project_type,
-    distribute_among
+    completion_rate_for_project_type, distribute_among
 )
+from utils.ids import uuid_stream
 
 
 # Task name templates by department
@@ -148,74 +145,107 @@ NAMES = ["new hire", "team member", "contractor"]
 METRICS = ["conversion", "retention", "engagement", "churn"]
 
 
+REPORTS = ["weekly", "monthly", "quarterly"]
+
+# Placeholder pools keyed by the names used in TASK_TEMPLATES
+_CHOICES = {
+    "component": COMPONENTS,
+    "action": ACTIONS,
+    "feature": FEATURES,
+    "bug_description": BUG_DESCRIPTIONS,
+    "reason": REASONS,
+    "issue": ISSUES,
+    "tool": TOOLS,
+    "target": TARGETS,
+    "topic": TOPICS,
+    "competitor": COMPETITORS,
+    "campaign": CAMPAIGNS,
+    "page": PAGES,
+    "asset": ASSETS,
+    "period": PERIODS,
+    "event": EVENTS,
+    "company": COMPANIES,
+    "region": REGIONS,
+    "vertical": VERTICALS,
+    "process": PROCESSES,
+    "document": DOCUMENTS,
+    "system": SYSTEMS,
+    "request": REQUESTS,
+    "policy": POLICIES,
+    "department": DEPARTMENTS,
+    "role": ROLES,
+    "name": NAMES,
+    "metric": METRICS,
+    "report": REPORTS,
+}
+
+
+class _LazyFill(dict):
+    """format_map mapping that draws a value only for the placeholders
+    a template actually contains, instead of sampling every pool and
+    running ~30 replace passes per task."""
+
+    def __missing__(self, key):
+        if key == "quarter":
+            return f"Q{random.randint(1, 4)}"
+        return random.choice(_CHOICES[key])
+
+
 def _fill_task_template(template: str) -> str:
     """Fill placeholders in task template."""
-    replacements = {
-        "{component}": random.choice(COMPONENTS),
-        "{action}": random.choice(ACTIONS),
-        "{feature}": random.choice(FEATURES),
-        "{bug_description}": random.choice(BUG_DESCRIPTIONS),
-        "{reason}": random.choice(REASONS),
-        "{issue}": random.choice(ISSUES),
-        "{tool}": random.choice(TOOLS),
-        "{target}": random.choice(TARGETS),
-        "{topic}": random.choice(TOPICS),
-        "{competitor}": random.choice(COMPETITORS),
-        "{campaign}": random.choice(CAMPAIGNS),
-        "{page}": random.choice(PAGES),
-        "{asset}": random.choice(ASSETS),
-        "{period}": random.choice(PERIODS),
-        "{event}": random.choice(EVENTS),
-        "{company}": random.choice(COMPANIES),
-        "{region}": random.choice(REGIONS),
-        "{vertical}": random.choice(VERTICALS),
-        "{process}": random.choice(PROCESSES),
-        "{document}": random.choice(DOCUMENTS),
-        "{system}": random.choice(SYSTEMS),
-        "{request}": random.choice(REQUESTS),
-        "{policy}": random.choice(POLICIES),
-        "{department}": random.choice(DEPARTMENTS),
-        "{role}": random.choice(ROLES),
-        "{name}": random.choice(NAMES),
-        "{quarter}": f"Q{random.randint(1, 4)}",
-        "{metric}": random.choice(METRICS),
-        "{report}": random.choice(["weekly", "monthly", "quarterly"]),
-    }
-    
-    result = template
-    for placeholder, value in replacements.items():
-        result = result.replace(placeholder, value)
-    return result
+    if "{" not in template:
+        return template
+    return template.format_map(_LazyFill())
+
+
+# Static description pieces, hoisted so _generate_description doesn't
+# rebuild them per task; the two name-dependent briefs are formatted
+# only when actually drawn
+_BRIEF_STATIC = (
+    "Priority item for the team.",
+    "Follow up from team discussion.",
+    "Blocked by dependencies - check status before starting.",
+)
+
+_BULLETS = (
+    "- Review existing implementation",
+    "- Update relevant documentation",
+    "- Add test coverage",
+    "- Get code review approval",
+    "- Deploy to staging first",
+    "- Monitor for issues after deploy",
+    "- Update stakeholders on completion",
+)
+
+# Every possible detailed description, grouped by bullet count: each
+# bucket enumerates the ordered picks of k bullets from 7 (42/210/840
+# strings), built once at import. Drawing the bucket uniformly and then
+# a string within it keeps random.sample's distribution — 1/3 per
+# bullet count, randomized bullet order — at two table lookups
+_DETAIL_STRINGS_BY_COUNT = tuple(
+    tuple(
+        "Acceptance criteria:\n" + "\n".join(combo)
+        for combo in permutations(_BULLETS, k)
+    )
+    for k in (2, 3, 4)
+)
 
 
 def _generate_description(name: str, dept: str) -> Optional[str]:
     """Generate task description (20% empty)."""
     if random.random() < 0.20:
         return None
-    
+
     # 50% brief, 30% detailed
     if random.random() < 0.625:  # 50/80 = brief among non-empty
-        templates = [
-            f"Complete the task: {name}",
-            f"Work on {name.lower()} as part of current sprint.",
-            f"Priority item for the team.",
-            f"Follow up from team discussion.",
-            f"Blocked by dependencies - check status before starting.",
-        ]
-        return random.choice(templates)
-    else:
-        # Detailed with bullet points
-        bullets = [
-            "- Review existing implementation",
-            "- Update relevant documentation",
-            "- Add test coverage",
-            "- Get code review approval",
-            "- Deploy to staging first",
-            "- Monitor for issues after deploy",
-            "- Update stakeholders on completion",
-        ]
-        selected = random.sample(bullets, k=random.randint(2, 4))
-        return f"Acceptance criteria:\n" + "\n".join(selected)
+        idx = random.randrange(5)
+        if idx == 0:
+            return f"Complete the task: {name}"
+        if idx == 1:
+            return f"Work on {name.lower()} as part of current sprint."
+        return _BRIEF_STATIC[idx - 2]
+
+    return random.choice(_DETAIL_STRINGS_BY_COUNT[random.randrange(3)])
 
 
 def generate_task(
@@ -230,11 +260,12 @@ def generate_task(
     completed: bool,
     completed_at: Optional[datetime],
     position: int,
-    parent_task_id: Optional[str] = None
+    parent_task_id: Optional[str] = None,
+    task_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """Generate a single task record."""
     return {
-        "id": str(uuid.uuid4()),
+        "id": task_id if task_id is not None else str(uuid.uuid4()),
         "name": name,
         "description": description,
         "project_id": project_id,
@@ -247,6 +278,11 @@ def generate_task(
         "completed": 1 if completed else 0,
         "completed_at": format_timestamp(completed_at) if completed_at else None,
         "position": position,
+        # Raw datetimes for downstream generators (subtasks, comments),
+        # so they never re-parse the formatted strings; stripped before
+        # insert like the other underscore fields
+        "_created_at_dt": created_at,
+        "_completed_at_dt": completed_at,
     }
 
 
@@ -277,7 +313,16 @@ def generate_tasks(
         List of task records (parent tasks only, not subtasks)
     """
     tasks = []
-    
+
+    # Bind the seeded module RNG's methods once: the inner loop draws
+    # several values per task and each random.X reference costs an
+    # attribute lookup
+    rand = random.random
+    choice = random.choice
+
+    # Mint ids in chunked batches instead of one urandom read per record
+    task_ids = uuid_stream()
+
     # Build lookups
     project_sections = {}
     for section in sections:
@@ -321,16 +366,16 @@ def generate_tasks(
         
         # Get team members for this project
         project_team_id = project["team_id"]
-        available_assignees = [
+        available_assignees = tuple(
             uid for uid in team_members.get(project_team_id, [])
             if uid in active_user_ids
-        ]
-        
+        )
+
         if not available_assignees:
-            available_assignees = list(active_user_ids)[:10]  # Fallback
+            available_assignees = tuple(active_user_ids)[:10]  # Fallback
         
         # Project creation date
-        project_created = datetime.strptime(project["created_at"], "%Y-%m-%d %H:%M:%S")
+        project_created = datetime.fromisoformat(project["created_at"])
         
         # Determine completion rate based on project type/status
         if project["status"] == "completed" or project["archived"]:
@@ -340,25 +385,40 @@ def generate_tasks(
                 "sprint" if "Sprint" in project["name"] else "ongoing"
             )
         
-        # Section weights (more tasks in later stages means more completed)
-        num_sections = len(proj_sections)
-        
+        # Creation window is constant per project; compute the bounds
+        # once instead of re-deriving max() and the end offset per task
+        created_lo = max(project_created, simulation_start)
+        created_hi = simulation_end - timedelta(hours=1)
+
+        # Section draw table (weighted toward earlier stages), built once
+        # per project so random.choices skips its per-call accumulate
+        non_done_sections = proj_sections[:-1] if len(proj_sections) > 1 else proj_sections
+        section_cum_weights = list(accumulate(
+            1.0 / (idx + 1) for idx in range(len(non_done_sections))
+        ))
+
+        # Creation dates and due dates for the whole project in two
+        # batched draws (due-date buckets are sampled in one choices
+        # call) rather than per task inside the loop
+        created_ats = [
+            random_business_date(created_lo, created_hi)
+            for _ in range(task_count)
+        ]
+        due_dates = generate_due_dates(created_ats, now=simulation_end)
+
         for i in range(task_count):
             # Generate task name
-            template = random.choice(templates)
+            template = choice(templates)
             name = _fill_task_template(template)
-            
+
             # Generate description
             description = _generate_description(name, dept)
-            
+
             # Task creation date
-            created_at = random_business_date(
-                max(project_created, simulation_start),
-                simulation_end - timedelta(hours=1)
-            )
-            
+            created_at = created_ats[i]
+
             # Determine if completed
-            completed = biased_boolean(completion_rate)
+            completed = rand() < completion_rate
             
             # Determine section based on completion status
             if completed:
@@ -366,29 +426,29 @@ def generate_tasks(
                 section = proj_sections[-1]
             else:
                 # Distribute among other sections (weighted toward earlier)
-                non_done_sections = proj_sections[:-1] if len(proj_sections) > 1 else proj_sections
-                weights = [1.0 / (idx + 1) for idx in range(len(non_done_sections))]
-                section = random.choices(non_done_sections, weights=weights, k=1)[0]
+                section = random.choices(
+                    non_done_sections, cum_weights=section_cum_weights, k=1
+                )[0]
             
             # Completion time
             completed_at = None
             if completed:
                 completed_at = generate_completion_time(created_at, simulation_end)
             
-            # Due date
-            due_date = generate_due_date(created_at, now=simulation_end)
-            
+            # Due date (pre-drawn for the project batch above)
+            due_date = due_dates[i]
+
             # Assignee (15% unassigned)
-            if biased_boolean(unassigned_rate):
+            if rand() < unassigned_rate:
                 assignee_id = None
             else:
-                assignee_id = random.choice(available_assignees)
-            
+                assignee_id = choice(available_assignees)
+
             # Creator (usually assignee or team lead)
-            if assignee_id and random.random() < 0.7:
+            if assignee_id and rand() < 0.7:
                 created_by_id = assignee_id
             else:
-                created_by_id = random.choice(available_assignees)
+                created_by_id = choice(available_assignees)
             
             task = generate_task(
                 name=name,
@@ -401,7 +461,8 @@ def generate_tasks(
                 due_date=due_date,
                 completed=completed,
                 completed_at=completed_at,
-                position=i
+                position=i,
+                task_id=next(task_ids)
             )
             tasks.append(task)
     
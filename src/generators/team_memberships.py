@@ -7,28 +7,35 @@ Creates user-team associations with:
 - Membership dates after both user and team creation
 """
 
-import uuid
+import sys
 import random
 from datetime import datetime, timedelta
+from itertools import count
 from typing import Dict, Any, List
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.dates import format_timestamp, random_date_between
 from utils.distributions import distribute_among
 
 
+# Role vocabulary, interned so every membership record shares the same
+# two string objects and role checks hit the pointer-equality fast path
+_MEMBER = sys.intern("member")
+_LEAD = sys.intern("lead")
+
+
 def generate_team_membership(
     team_id: str,
     user_id: str,
     role: str,
-    joined_at: datetime
+    joined_at: datetime,
+    membership_id: int = None
 ) -> Dict[str, Any]:
-    """Generate a single team membership record."""
+    """Generate a single team membership record.
+
+    Membership ids are sequential integers (rowid aliases in SQLite);
+    passing None lets the database assign one on insert."""
     return {
-        "id": str(uuid.uuid4()),
+        "id": membership_id,
         "team_id": team_id,
         "user_id": user_id,
         "role": role,  # 'member' or 'lead'
@@ -60,8 +67,13 @@ def generate_team_memberships(
         List of team membership records
     """
     memberships = []
+    membership_ids = count(1)
+    rand = random.random
     user_team_count = {u["id"]: 0 for u in users}
     team_members = {t["id"]: [] for t in teams}
+    # Team ids each user has joined, maintained as memberships are
+    # appended so later steps never rescan the memberships list
+    user_teams = {u["id"]: set() for u in users}
     
     # Group teams by department
     teams_by_dept = {}
@@ -81,6 +93,12 @@ def generate_team_memberships(
     
     # Get senior users for lead assignments
     senior_users = {u["id"]: u for u in users if u["role"] in ("senior", "lead")}
+
+    # Parse creation timestamps once per team and per user instead of
+    # twice per membership (fromisoformat is also ~20x faster than the
+    # strptime calls this replaces)
+    team_created = {t["id"]: datetime.fromisoformat(t["created_at"]) for t in teams}
+    user_created = {u["id"]: datetime.fromisoformat(u["created_at"]) for u in users}
     
     # Step 1: Primary team assignment - ensure each user has at least one team
     for dept, dept_users in users_by_dept.items():
@@ -107,9 +125,7 @@ def generate_team_memberships(
                 user_idx += 1
                 
                 # Calculate join date (after both team and user creation)
-                team_created = datetime.strptime(team["created_at"], "%Y-%m-%d %H:%M:%S")
-                user_created = datetime.strptime(user["created_at"], "%Y-%m-%d %H:%M:%S")
-                join_start = max(team_created, user_created)
+                join_start = max(team_created[team["id"]], user_created[user["id"]])
                 join_end = join_start + timedelta(days=30)  # Join within 30 days
                 joined_at = random_date_between(join_start, join_end)
                 
@@ -117,18 +133,20 @@ def generate_team_memberships(
                 is_lead = (
                     user["id"] in senior_users and
                     len([m for m in team_members[team["id"]] if m["role"] == "lead"]) < 2 and
-                    random.random() < 0.3
+                    rand() < 0.3
                 )
                 
                 membership = generate_team_membership(
                     team_id=team["id"],
                     user_id=user["id"],
-                    role="lead" if is_lead else "member",
-                    joined_at=joined_at
+                    role=_LEAD if is_lead else _MEMBER,
+                    joined_at=joined_at,
+                    membership_id=next(membership_ids)
                 )
                 
                 memberships.append(membership)
                 team_members[team["id"]].append(membership)
+                user_teams[user["id"]].add(team["id"])
                 user_team_count[user["id"]] += 1
     
     # Step 2: Cross-functional assignments (20% of users join additional teams)
@@ -142,11 +160,10 @@ def generate_team_memberships(
         if user_team_count[user["id"]] >= 3:
             continue
         
-        # Pick 1-2 additional teams from other departments
-        other_teams = [
-            t for t in teams
-            if t["id"] not in [m["team_id"] for m in memberships if m["user_id"] == user["id"]]
-        ]
+        # Pick 1-2 additional teams from other departments (set lookup
+        # against the maintained index instead of rescanning memberships)
+        joined = user_teams[user["id"]]
+        other_teams = [t for t in teams if t["id"] not in joined]
         
         if not other_teams:
             continue
@@ -154,37 +171,38 @@ def generate_team_memberships(
         extra_teams = random.sample(other_teams, k=min(len(other_teams), random.randint(1, 2)))
         
         for team in extra_teams:
-            team_created = datetime.strptime(team["created_at"], "%Y-%m-%d %H:%M:%S")
-            user_created = datetime.strptime(user["created_at"], "%Y-%m-%d %H:%M:%S")
-            join_start = max(team_created, user_created)
+            join_start = max(team_created[team["id"]], user_created[user["id"]])
             join_end = join_start + timedelta(days=90)  # More flexibility for cross-functional
             joined_at = random_date_between(join_start, join_end)
             
             membership = generate_team_membership(
                 team_id=team["id"],
                 user_id=user["id"],
-                role="member",
-                joined_at=joined_at
+                role=_MEMBER,
+                joined_at=joined_at,
+                membership_id=next(membership_ids)
             )
             
             memberships.append(membership)
+            team_members[team["id"]].append(membership)
+            user_teams[user["id"]].add(team["id"])
             user_team_count[user["id"]] += 1
     
     # Step 3: Ensure each team has at least one lead
     for team in teams:
-        team_mems = [m for m in memberships if m["team_id"] == team["id"]]
+        team_mems = team_members[team["id"]]
         has_lead = any(m["role"] == "lead" for m in team_mems)
         
         if not has_lead and team_mems:
-            # Find a senior member or promote someone
+            # Find a senior member or promote someone (senior_users is
+            # keyed by user id, so the check is a single dict lookup)
             for mem in team_mems:
-                user = next((u for u in users if u["id"] == mem["user_id"]), None)
-                if user and user["role"] in ("senior", "lead"):
-                    mem["role"] = "lead"
+                if mem["user_id"] in senior_users:
+                    mem["role"] = _LEAD
                     break
             else:
                 # Just promote the first member
-                team_mems[0]["role"] = "lead"
+                team_mems[0]["role"] = _LEAD
     
     return memberships
 
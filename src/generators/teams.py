@@ -13,47 +13,45 @@ Creates teams/departments with realistic distribution:
 import uuid
 import random
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Any, List
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.dates import format_timestamp, random_date_between
+from utils.ids import uuid_stream
 
 
 # Team name templates by department
 TEAM_TEMPLATES = {
-    "Engineering": [
+    "Engineering": (
         "Platform Engineering", "Backend Services", "Frontend Team",
         "Mobile Development", "DevOps", "Infrastructure", "API Team",
         "Data Engineering", "Security Engineering", "QA Engineering",
         "Site Reliability", "Core Services", "Developer Experience",
         "Cloud Platform", "ML Engineering", "Integrations Team",
-    ],
-    "Product": [
+    ),
+    "Product": (
         "Product Core", "Growth Product", "Enterprise Product",
         "Mobile Product", "Platform Product", "Analytics Product",
         "UX Research", "Product Operations",
-    ],
-    "Marketing": [
+    ),
+    "Marketing": (
         "Brand Marketing", "Content Marketing", "Growth Marketing",
         "Product Marketing", "Demand Generation", "Marketing Operations",
         "Events Team", "Social Media",
-    ],
-    "Sales": [
+    ),
+    "Sales": (
         "Enterprise Sales", "Mid-Market Sales", "SMB Sales",
         "Sales Development", "Solutions Engineering", "Sales Operations",
         "Customer Success", "Account Management",
-    ],
-    "Operations": [
+    ),
+    "Operations": (
         "Business Operations", "Finance", "Legal", "IT Operations",
         "Procurement", "Facilities",
-    ],
-    "HR": [
+    ),
+    "HR": (
         "People Operations", "Talent Acquisition", "Learning & Development",
         "HR Business Partners",
-    ],
+    ),
 }
 
 # Team descriptions by department
@@ -67,21 +65,32 @@ TEAM_DESCRIPTIONS = {
 }
 
 
+@lru_cache(maxsize=None)
+def _team_description(department: str, focus: str) -> str:
+    """Build (and memoize) a team description.
+
+    Teams repeat (department, focus) pairs rarely, but the cache also
+    acts as an interning pool: equal descriptions share one string
+    object instead of a fresh format() allocation each."""
+    return TEAM_DESCRIPTIONS.get(department, "Team focused on {focus}.").format(focus=focus.lower())
+
+
 def generate_team(
     name: str,
     department: str,
     organization_id: str,
-    created_at: datetime
+    created_at: datetime,
+    team_id: str = None
 ) -> Dict[str, Any]:
     """Generate a single team record."""
     # Generate description
     focus = name.replace(department, "").strip()
     if not focus:
         focus = "core"
-    description = TEAM_DESCRIPTIONS.get(department, "Team focused on {focus}.").format(focus=focus.lower())
-    
+    description = _team_description(department, focus)
+
     return {
-        "id": str(uuid.uuid4()),
+        "id": team_id if team_id is not None else str(uuid.uuid4()),
         "name": name,
         "description": description,
         "organization_id": organization_id,
@@ -108,7 +117,12 @@ def generate_teams(
         List of team records
     """
     teams = []
-    used_names = set()
+    # Per-department counter for fallback names: deterministic suffixes
+    # guarantee uniqueness without rejection sampling
+    fallback_counts = {}
+
+    # Mint ids in chunked batches instead of one urandom read per record
+    team_ids = uuid_stream()
     
     # Calculate teams per department
     departments = list(department_distribution.keys())
@@ -142,20 +156,24 @@ def generate_teams(
     team_creation_window = org_created_at + timedelta(days=180)
     
     for department, count in team_counts.items():
-        available_names = [n for n in TEAM_TEMPLATES.get(department, []) if n not in used_names]
-        
+        # Template names are unique across TEAM_TEMPLATES, so no
+        # cross-department dedup filter is needed; shuffle once so each
+        # pop() takes the last element in O(1) instead of shifting the
+        # tail on every random-index pop
+        available_names = list(TEAM_TEMPLATES.get(department, ()))
+        random.shuffle(available_names)
+
         for i in range(count):
             # Pick a name
             if available_names:
-                name = available_names.pop(random.randint(0, len(available_names) - 1))
+                name = available_names.pop()
             else:
-                # Generate a unique name
-                name = f"{department} Team {i + 1}"
-                while name in used_names:
-                    name = f"{department} Team {random.randint(1, 100)}"
-            
-            used_names.add(name)
-            
+                # Generate a unique name via a counted suffix (the old
+                # rejection loop over 100 random suffixes could collide
+                # indefinitely)
+                fallback_counts[department] = fallback_counts.get(department, 0) + 1
+                name = f"{department} Team {fallback_counts[department]}"
+
             # Random creation date within window
             created_at = random_date_between(
                 org_created_at + timedelta(days=1),
@@ -166,7 +184,8 @@ def generate_teams(
                 name=name,
                 department=department,
                 organization_id=organization_id,
-                created_at=created_at
+                created_at=created_at,
+                team_id=next(team_ids)
             )
             team["department"] = department  # Store for later use
             teams.append(team)
@@ -8,18 +8,17 @@ Creates realistic user profiles with:
 - 5% inactive/deactivated accounts
 """
 
+import sys
 import uuid
 import random
+from collections import defaultdict
 from datetime import datetime, timedelta
+from itertools import accumulate
 from typing import Dict, Any, List
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.dates import format_timestamp, generate_staggered_dates
 from utils.names import generate_unique_names, generate_unique_emails
-from utils.distributions import weighted_choice, biased_boolean
+from utils.ids import uuid_stream
 
 
 def generate_user(
@@ -28,11 +27,12 @@ def generate_user(
     role: str,
     department: str,
     created_at: datetime,
-    is_active: bool = True
+    is_active: bool = True,
+    user_id: str = None
 ) -> Dict[str, Any]:
     """Generate a single user record."""
     return {
-        "id": str(uuid.uuid4()),
+        "id": user_id if user_id is not None else str(uuid.uuid4()),
         "email": email,
         "name": name,
         "role": role,
@@ -78,34 +78,52 @@ def generate_users(
         distribution="growth"
     )
     
-    # Prepare departments list weighted by distribution
-    departments = list(department_distribution.keys())
-    dept_weights = list(department_distribution.values())
-    
+    # Draw every role and department up front: one random.choices call
+    # per attribute amortizes the weight-table setup over all users
+    # instead of rebuilding it per draw
+    # Intern the small role/department vocabularies so every user record
+    # references the canonical string objects (cheaper dict keys and
+    # pointer-fast equality in the grouping helpers downstream).
+    # Cumulative weights are accumulated once here; passing cum_weights
+    # skips the accumulate pass random.choices would otherwise redo
+    roles = random.choices(
+        [sys.intern(r) for r in role_distribution],
+        cum_weights=list(accumulate(role_distribution.values())),
+        k=num_users
+    )
+    departments = random.choices(
+        [sys.intern(d) for d in department_distribution],
+        cum_weights=list(accumulate(department_distribution.values())),
+        k=num_users
+    )
+
+    # Turnover thresholds, hoisted out of the loop
+    p_inactive_tenured = inactive_rate * 1.5  # Higher turnover for long-term
+    p_inactive_recent = inactive_rate * 0.5  # Lower turnover for new hires
+    tenure_cutoff = simulation_end - timedelta(days=365)
+    rand = random.random
+
     users = []
-    
-    for i, (name, email, hire_date) in enumerate(zip(names, emails, hire_dates)):
-        # Assign role based on distribution
-        role = weighted_choice(role_distribution)
-        
-        # Assign department based on distribution
-        department = random.choices(departments, weights=dept_weights, k=1)[0]
-        
+    user_ids = uuid_stream()
+
+    for name, email, hire_date, role, department in zip(
+        names, emails, hire_dates, roles, departments
+    ):
         # Determine if active (newer users more likely active)
         # Older users have higher chance of being inactive (turnover)
-        days_employed = (simulation_end - hire_date).days
-        if days_employed > 365:
-            is_active = not biased_boolean(inactive_rate * 1.5)  # Higher turnover for long-term
+        if hire_date < tenure_cutoff:
+            is_active = rand() >= p_inactive_tenured
         else:
-            is_active = not biased_boolean(inactive_rate * 0.5)  # Lower turnover for new hires
-        
+            is_active = rand() >= p_inactive_recent
+
         user = generate_user(
             name=name,
             email=email,
             role=role,
             department=department,
             created_at=hire_date,
-            is_active=is_active
+            is_active=is_active,
+            user_id=next(user_ids)
         )
         users.append(user)
     
@@ -114,13 +132,12 @@ def generate_users(
 
 def get_users_by_department(users: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
     """Group users by department."""
-    by_dept = {}
+    # defaultdict costs one hash lookup per user instead of the
+    # membership-test-then-index pair
+    by_dept = defaultdict(list)
     for user in users:
-        dept = user["department"]
-        if dept not in by_dept:
-            by_dept[dept] = []
-        by_dept[dept].append(user)
-    return by_dept
+        by_dept[user["department"]].append(user)
+    return dict(by_dept)
 
 
 def get_active_users(users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
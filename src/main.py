@@ -22,8 +22,11 @@ import config
 
 # Import database
 from database import Database
+from utils.dates import frozen_now
 
 # Import generators
+from generators.comments import COMMENT_COLUMNS
+from generators.tags import TASK_TAG_COLUMNS
 from generators import (
     generate_organizations,
     generate_teams,
@@ -72,149 +75,160 @@ def main():
     # Initialize schema
     db.initialize_schema()
     
-    # =========================================================================
-    # PHASE 1: Core Entities
-    # =========================================================================
-    logger.info("\n--- Phase 1: Core Entities ---")
-    
-    # Generate organization
-    logger.info("Generating organization...")
-    organizations = generate_organizations(config)
-    db.insert_many("organizations", organizations)
-    org_id = organizations[0]["id"]
-    
-    # Generate teams
-    logger.info(f"Generating {config.NUM_TEAMS} teams...")
-    teams = generate_teams(
-        organization_id=org_id,
-        num_teams=config.NUM_TEAMS,
-        org_created_at=config.ORG_CREATED_AT,
-        department_distribution=config.DEPARTMENT_DISTRIBUTION
-    )
-    # Remove department field before insert (not in schema)
-    teams_for_db = [{k: v for k, v in t.items() if k != "department"} for t in teams]
-    db.insert_many("teams", teams_for_db)
-    
-    # Generate users
-    logger.info(f"Generating {config.NUM_USERS} users...")
-    users = generate_users(
-        num_users=config.NUM_USERS,
-        domain=config.ORGANIZATION_DOMAIN,
-        org_created_at=config.ORG_CREATED_AT,
-        simulation_end=config.SIMULATION_END,
-        role_distribution=config.ROLE_DISTRIBUTION,
-        department_distribution=config.DEPARTMENT_DISTRIBUTION,
-        inactive_rate=config.INACTIVE_USER_RATE
-    )
-    db.insert_many("users", users)
-    
-    # Generate team memberships
-    logger.info("Generating team memberships...")
-    memberships = generate_team_memberships(
-        teams=teams,
-        users=users,
-        min_team_size=config.MIN_TEAM_SIZE,
-        max_team_size=config.MAX_TEAM_SIZE
-    )
-    db.insert_many("team_memberships", memberships)
+    # All generation inserts share one transaction: a single commit
+    # (and fsync) at the end instead of one per insert_many call.
+    # Pinning "now" to the simulation end keeps any date helper that
+    # defaults to the current time off the clock syscall and anchored
+    # to the simulated timeline.
+    with frozen_now(config.SIMULATION_END), db.transaction():
+        # =========================================================================
+        # PHASE 1: Core Entities
+        # =========================================================================
+        logger.info("\n--- Phase 1: Core Entities ---")
     
-    # =========================================================================
-    # PHASE 2: Projects & Sections
-    # =========================================================================
-    logger.info("\n--- Phase 2: Projects & Sections ---")
-    
-    # Generate projects
-    logger.info(f"Generating {config.NUM_PROJECTS} projects...")
-    projects = generate_projects(
-        teams=teams,
-        team_memberships=memberships,
-        users=users,
-        num_projects=config.NUM_PROJECTS,
-        simulation_start=config.SIMULATION_START,
-        simulation_end=config.SIMULATION_END
-    )
-    # Remove department field before insert
-    projects_for_db = [{k: v for k, v in p.items() if k != "department"} for p in projects]
-    db.insert_many("projects", projects_for_db)
-    
-    # Generate sections
-    logger.info("Generating sections...")
-    sections = generate_sections(projects)
-    db.insert_many("sections", sections)
+        # Generate organization
+        logger.info("Generating organization...")
+        organizations = generate_organizations(config)
+        db.insert_many("organizations", organizations)
+        org_id = organizations[0]["id"]
     
-    # =========================================================================
-    # PHASE 3: Tasks & Subtasks
-    # =========================================================================
-    logger.info("\n--- Phase 3: Tasks & Subtasks ---")
-    
-    # Generate tasks
-    logger.info(f"Generating {config.NUM_TASKS} tasks...")
-    tasks = generate_tasks(
-        projects=projects,
-        sections=sections,
-        team_memberships=memberships,
-        users=users,
-        num_tasks=config.NUM_TASKS,
-        simulation_start=config.SIMULATION_START,
-        simulation_end=config.SIMULATION_END,
-        unassigned_rate=config.UNASSIGNED_TASK_RATE
-    )
-    db.insert_many("tasks", tasks)
-    
-    # Generate subtasks
-    logger.info("Generating subtasks...")
-    subtasks = generate_subtasks(
-        tasks=tasks,
-        subtask_rate=config.SUBTASK_RATE,
-        simulation_end=config.SIMULATION_END
-    )
-    db.insert_many("tasks", subtasks)  # Same table as tasks
-    
-    # Combine for comments/tags
-    all_tasks = tasks + subtasks
+        # Generate teams
+        logger.info(f"Generating {config.NUM_TEAMS} teams...")
+        teams = generate_teams(
+            organization_id=org_id,
+            num_teams=config.NUM_TEAMS,
+            org_created_at=config.ORG_CREATED_AT,
+            department_distribution=config.DEPARTMENT_DISTRIBUTION
+        )
+        # Remove department field before insert (not in schema); stream
+        # the projection so no second copy of the rows is materialized
+        db.insert_many("teams", ({k: v for k, v in t.items() if k != "department"} for t in teams))
     
-    # =========================================================================
-    # PHASE 4: Collaboration
-    # =========================================================================
-    logger.info("\n--- Phase 4: Collaboration ---")
-    
-    # Generate comments
-    logger.info("Generating comments...")
-    comments = generate_comments(
-        tasks=all_tasks,
-        team_memberships=memberships,
-        users=users,
-        simulation_end=config.SIMULATION_END
-    )
-    db.insert_many("comments", comments)
+        # Generate users
+        logger.info(f"Generating {config.NUM_USERS} users...")
+        users = generate_users(
+            num_users=config.NUM_USERS,
+            domain=config.ORGANIZATION_DOMAIN,
+            org_created_at=config.ORG_CREATED_AT,
+            simulation_end=config.SIMULATION_END,
+            role_distribution=config.ROLE_DISTRIBUTION,
+            department_distribution=config.DEPARTMENT_DISTRIBUTION,
+            inactive_rate=config.INACTIVE_USER_RATE
+        )
+        db.insert_many("users", users)
     
-    # =========================================================================
-    # PHASE 5: Metadata
-    # =========================================================================
-    logger.info("\n--- Phase 5: Metadata ---")
-    
-    # Generate custom field definitions
-    logger.info("Generating custom fields...")
-    field_definitions = generate_custom_field_definitions(org_id)
-    # Remove _distribution field before insert
-    field_defs_for_db = [{k: v for k, v in f.items() if not k.startswith("_")} for f in field_definitions]
-    db.insert_many("custom_field_definitions", field_defs_for_db)
-    
-    # Generate custom field values
-    field_values = generate_custom_field_values(
-        field_definitions=field_definitions,
-        tasks=tasks  # Only parent tasks
-    )
-    db.insert_many("custom_field_values", field_values)
-    
-    # Generate tags
-    logger.info("Generating tags...")
-    tags = generate_tags(org_id)
-    db.insert_many("tags", tags)
-    
-    # Generate task-tag associations
-    task_tags = generate_task_tags(tasks=tasks, tags=tags)
-    db.insert_many("task_tags", task_tags)
+        # Generate team memberships
+        logger.info("Generating team memberships...")
+        memberships = generate_team_memberships(
+            teams=teams,
+            users=users,
+            min_team_size=config.MIN_TEAM_SIZE,
+            max_team_size=config.MAX_TEAM_SIZE
+        )
+        db.insert_many("team_memberships", memberships)
+    
+        # =========================================================================
+        # PHASE 2: Projects & Sections
+        # =========================================================================
+        logger.info("\n--- Phase 2: Projects & Sections ---")
+    
+        # Generate projects
+        logger.info(f"Generating {config.NUM_PROJECTS} projects...")
+        projects = generate_projects(
+            teams=teams,
+            team_memberships=memberships,
+            users=users,
+            num_projects=config.NUM_PROJECTS,
+            simulation_start=config.SIMULATION_START,
+            simulation_end=config.SIMULATION_END
+        )
+        # Remove department field before insert
+        db.insert_many("projects", ({k: v for k, v in p.items() if k != "department"} for p in projects))
+    
+        # Generate sections
+        logger.info("Generating sections...")
+        sections = generate_sections(projects)
+        db.insert_many("sections", sections)
+    
+        # =========================================================================
+        # PHASE 3: Tasks & Subtasks
+        # =========================================================================
+        logger.info("\n--- Phase 3: Tasks & Subtasks ---")
+    
+        # Generate tasks
+        logger.info(f"Generating {config.NUM_TASKS} tasks...")
+        tasks = generate_tasks(
+            projects=projects,
+            sections=sections,
+            team_memberships=memberships,
+            users=users,
+            num_tasks=config.NUM_TASKS,
+            simulation_start=config.SIMULATION_START,
+            simulation_end=config.SIMULATION_END,
+            unassigned_rate=config.UNASSIGNED_TASK_RATE
+        )
+        # Remove raw-datetime carrier fields before insert
+        db.insert_many("tasks", ({k: v for k, v in t.items() if not k.startswith("_")} for t in tasks))
+
+        # Generate subtasks
+        logger.info("Generating subtasks...")
+        subtasks = generate_subtasks(
+            tasks=tasks,
+            subtask_rate=config.SUBTASK_RATE,
+            simulation_end=config.SIMULATION_END
+        )
+        db.insert_many(  # Same table as tasks
+            "tasks",
+            ({k: v for k, v in t.items() if not k.startswith("_")} for t in subtasks)
+        )
+    
+        # Combine for comments/tags
+        all_tasks = tasks + subtasks
+    
+        # =========================================================================
+        # PHASE 4: Collaboration
+        # =========================================================================
+        logger.info("\n--- Phase 4: Collaboration ---")
+    
+        # Generate comments
+        logger.info("Generating comments...")
+        comments = generate_comments(
+            tasks=all_tasks,
+            team_memberships=memberships,
+            users=users,
+            simulation_end=config.SIMULATION_END
+        )
+        db.insert_many_tuples("comments", COMMENT_COLUMNS, comments)
+    
+        # =========================================================================
+        # PHASE 5: Metadata
+        # =========================================================================
+        logger.info("\n--- Phase 5: Metadata ---")
+    
+        # Generate custom field definitions
+        logger.info("Generating custom fields...")
+        field_definitions = generate_custom_field_definitions(org_id)
+        # Remove _distribution field before insert
+        db.insert_many(
+            "custom_field_definitions",
+            ({k: v for k, v in f.items() if not k.startswith("_")} for f in field_definitions)
+        )
+    
+        # Generate custom field values
+        field_values = generate_custom_field_values(
+            field_definitions=field_definitions,
+            tasks=tasks  # Only parent tasks
+        )
+        db.insert_many("custom_field_values", field_values)
+    
+        # Generate tags
+        logger.info("Generating tags...")
+        tags = generate_tags(org_id)
+        db.insert_many("tags", tags)
+    
+        # Generate task-tag associations
+        task_tags = generate_task_tags(tasks=tasks, tags=tags)
+        db.insert_many_tuples("task_tags", TASK_TAG_COLUMNS, task_tags)
     
     # =========================================================================
     # VALIDATION
@@ -226,6 +240,9 @@ def main():
     logger.info("Table row counts:")
     for table, count in stats.items():
         logger.info(f"  {table}: {count:,}")
+
+    # Cache counts so check_db.py can read them without full scans
+    db.cache_table_counts(stats)
     
     # Validate integrity
     issues = db.validate_integrity()
@@ -12,8 +12,17 @@ Falls back to built-in defaults if files don't exist.
 
 import os
 import json
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
+try:
+    # Optional accelerator: parses 2-5x faster than stdlib json when
+    # installed; the pipeline works identically without it
+    import orjson
+    _parse_json = orjson.loads
+except ImportError:
+    _parse_json = json.loads
+
 # Base directory for data files
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -22,13 +31,17 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 def _load_json_file(filename: str) -> Optional[Any]:
     """Load JSON file from data directory."""
     filepath = os.path.join(DATA_DIR, filename)
-    
+
     if os.path.exists(filepath):
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Read bytes and parse in one shot: both parsers accept bytes,
+        # and this skips the incremental TextIOWrapper decode json.load
+        # would do on a text-mode handle
+        with open(filepath, 'rb') as f:
+            return _parse_json(f.read())
     return None
 
 
+@lru_cache(maxsize=None)
 def load_first_names() -> List[Dict[str, Any]]:
     """
     Load first names with weights from census data.
@@ -52,6 +65,7 @@ def load_first_names() -> List[Dict[str, Any]]:
     ]
 
 
+@lru_cache(maxsize=None)
 def load_last_names() -> List[Dict[str, Any]]:
     """
     Load last names with weights from census data.
@@ -74,6 +88,7 @@ def load_last_names() -> List[Dict[str, Any]]:
     ]
 
 
+@lru_cache(maxsize=None)
 def load_task_templates() -> Dict[str, List[str]]:
     """
     Load task name templates by department.
@@ -102,6 +117,7 @@ def load_task_templates() -> Dict[str, List[str]]:
     }
 
 
+@lru_cache(maxsize=None)
 def load_project_templates() -> Dict[str, List[str]]:
     """
     Load project name templates by department.
@@ -122,6 +138,7 @@ def load_project_templates() -> Dict[str, List[str]]:
     }
 
 
+@lru_cache(maxsize=None)
 def load_comment_templates() -> Dict[str, List[str]]:
     """
     Load comment templates by type.
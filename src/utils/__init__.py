@@ -1,9 +1,11 @@
 """Utilities package for Asana simulation."""
 
 from .dates import (
+    frozen_now,
     random_date_between,
     random_business_date,
     generate_due_date,
+    generate_due_dates,
     generate_completion_time,
     generate_staggered_dates,
     format_timestamp,
@@ -11,15 +13,18 @@ from .dates import (
 )
 
 from .distributions import (
+    WeightedSampler,
     weighted_choice,
     weighted_sample,
     log_normal_int,
     normal_int,
     biased_boolean,
+    binomialvariate,
     random_subset,
     distribute_among,
     completion_rate_for_project_type,
     comment_count_for_task,
+    comment_counts_for_tasks,
     subtask_count_for_task,
 )
 
@@ -30,29 +35,48 @@ from .names import (
     generate_unique_emails,
 )
 
+from .ids import (
+    batch_uuids,
+    uuid_stream,
+)
+
+from .alias import (
+    Alias,
+)
+
 __all__ = [
     # dates
+    'frozen_now',
     'random_date_between',
     'random_business_date',
     'generate_due_date',
+    'generate_due_dates',
     'generate_completion_time',
     'generate_staggered_dates',
     'format_timestamp',
     'format_date',
     # distributions
+    'WeightedSampler',
     'weighted_choice',
     'weighted_sample',
     'log_normal_int',
     'normal_int',
     'biased_boolean',
+    'binomialvariate',
     'random_subset',
     'distribute_among',
     'completion_rate_for_project_type',
     'comment_count_for_task',
+    'comment_counts_for_tasks',
     'subtask_count_for_task',
     # names
     'generate_full_name',
     'generate_email',
     'generate_unique_names',
     'generate_unique_emails',
+    # ids
+    'batch_uuids',
+    'uuid_stream',
+    # alias
+    'Alias',
 ]
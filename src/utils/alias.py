@@ -0,0 +1,65 @@
+"""
+Vose alias-method sampler for fixed categorical distributions.
+
+Builds two O(k) tables once per distribution; each draw afterwards is
+two RNG calls and two array lookups, independent of the number of
+outcomes. Worth it for static weight tables (custom-field values,
+priorities) that are sampled far more often than they are built.
+"""
+
+import random
+from array import array
+from typing import Any, Dict, List
+
+
+class Alias:
+    """Alias-method sampler over a weights dict (outcome -> weight)."""
+
+    def __init__(self, options: Dict[Any, float]):
+        self.outcomes = list(options.keys())
+        weights = list(options.values())
+        k = len(weights)
+        total = sum(weights)
+
+        # Vose's construction: split scaled weights into under/overfull
+        # buckets and pair them off
+        scaled = array('d', (w * k / total for w in weights))
+        self._prob = array('d', [1.0] * k)
+        self._alias = array('l', [0] * k)
+
+        small = [i for i, w in enumerate(scaled) if w < 1.0]
+        large = [i for i, w in enumerate(scaled) if w >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            big = large.pop()
+            self._prob[s] = scaled[s]
+            self._alias[s] = big
+            scaled[big] -= 1.0 - scaled[s]
+            if scaled[big] < 1.0:
+                small.append(big)
+            else:
+                large.append(big)
+        # Leftovers (numerical drift) keep prob 1.0 and never alias
+
+    def sample(self) -> Any:
+        """Draw a single outcome."""
+        i = int(random.random() * len(self.outcomes))
+        if random.random() < self._prob[i]:
+            return self.outcomes[i]
+        return self.outcomes[self._alias[i]]
+
+    def sample_k(self, k: int) -> List[Any]:
+        """Draw k outcomes in one tight loop over locally bound tables."""
+        outcomes = self.outcomes
+        prob = self._prob
+        alias = self._alias
+        n = len(outcomes)
+        rand = random.random
+
+        result = []
+        append = result.append
+        for _ in range(k):
+            i = int(rand() * n)
+            append(outcomes[i] if rand() < prob[i] else outcomes[alias[i]])
+        return result
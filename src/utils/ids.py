@@ -0,0 +1,40 @@
+"""
+ID generation utilities.
+
+UUID strings are used as primary keys for every entity. Minting them in
+bulk amortizes the os.urandom entropy read across a whole batch instead
+of paying one syscall per uuid.uuid4() call.
+"""
+
+import os
+import uuid
+from typing import List
+
+
+def batch_uuids(count: int) -> List[str]:
+    """
+    Generate `count` UUID4 strings from a single os.urandom read.
+
+    Equivalent to [str(uuid.uuid4()) for _ in range(count)] but with one
+    entropy syscall for the whole batch.
+    """
+    if count <= 0:
+        return []
+
+    buf = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=buf[i:i + 16], version=4))
+        for i in range(0, 16 * count, 16)
+    ]
+
+
+def uuid_stream(chunk_size: int = 1024):
+    """
+    Yield an endless stream of UUID4 strings minted in chunks.
+
+    For generators whose record count isn't known up front: ids come
+    from batch_uuids-sized entropy reads, so callers just next() one
+    per record without counting first.
+    """
+    while True:
+        yield from batch_uuids(chunk_size)
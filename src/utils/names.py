@@ -8,56 +8,72 @@ Names are loaded from pre-curated JSON files based on Census data.
 import os
 import json
 import random
+from itertools import accumulate
 from typing import List, Tuple, Optional
 
-# Cache for loaded name data
-_first_names_cache: Optional[List[Tuple[str, float]]] = None
-_last_names_cache: Optional[List[Tuple[str, float]]] = None
+# Cache for loaded name data, stored transposed as
+# (names_tuple, cumulative_weights) so samplers can call
+# random.choices(cum_weights=...) directly without re-unzipping
+# (and re-summing) the pair list on every draw
+_first_names_cache: Optional[Tuple[tuple, list]] = None
+_last_names_cache: Optional[Tuple[tuple, list]] = None
+
+# Data directory, resolved once at import (abspath stats the filesystem,
+# so recomputing it per lookup is wasted syscalls)
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_DATA_DIR = os.path.join(_BASE_DIR, "data")
 
 
 def _get_data_path(filename: str) -> str:
     """Get path to data file."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    return os.path.join(base_dir, "data", filename)
+    return os.path.join(_DATA_DIR, filename)
+
+
+def _transpose_weighted(pairs: List[Tuple[str, float]]) -> Tuple[tuple, list]:
+    """Transpose (name, weight) pairs into (names, cumulative weights)."""
+    names, weights = zip(*pairs)
+    return names, list(accumulate(weights))
 
 
-def _load_first_names() -> List[Tuple[str, float]]:
-    """Load first names from data file."""
+def _load_first_names() -> Tuple[tuple, list]:
+    """Load first names from data file as (names, cumulative weights)."""
     global _first_names_cache
-    
+
     if _first_names_cache is not None:
         return _first_names_cache
-    
+
     filepath = _get_data_path("first_names.json")
-    
+
     if os.path.exists(filepath):
         with open(filepath, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            _first_names_cache = [(item["name"], item.get("weight", 1.0)) for item in data]
+            pairs = [(item["name"], item.get("weight", 1.0)) for item in data]
     else:
         # Fallback to built-in list if file not found
-        _first_names_cache = _get_fallback_first_names()
-    
+        pairs = _get_fallback_first_names()
+
+    _first_names_cache = _transpose_weighted(pairs)
     return _first_names_cache
 
 
-def _load_last_names() -> List[Tuple[str, float]]:
-    """Load last names from data file."""
+def _load_last_names() -> Tuple[tuple, list]:
+    """Load last names from data file as (names, cumulative weights)."""
     global _last_names_cache
-    
+
     if _last_names_cache is not None:
         return _last_names_cache
-    
+
     filepath = _get_data_path("last_names.json")
-    
+
     if os.path.exists(filepath):
         with open(filepath, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            _last_names_cache = [(item["name"], item.get("weight", 1.0)) for item in data]
+            pairs = [(item["name"], item.get("weight", 1.0)) for item in data]
     else:
         # Fallback to built-in list if file not found
-        _last_names_cache = _get_fallback_last_names()
-    
+        pairs = _get_fallback_last_names()
+
+    _last_names_cache = _transpose_weighted(pairs)
     return _last_names_cache
 
 
@@ -108,16 +124,12 @@ def _get_fallback_last_names() -> List[Tuple[str, float]]:
 
 def generate_full_name() -> str:
     """Generate a realistic full name."""
-    first_names = _load_first_names()
-    last_names = _load_last_names()
-    
-    # Weighted random selection
-    first_choices, first_weights = zip(*first_names)
-    last_choices, last_weights = zip(*last_names)
-    
-    first = random.choices(first_choices, weights=first_weights, k=1)[0]
-    last = random.choices(last_choices, weights=last_weights, k=1)[0]
-    
+    first_choices, first_cum = _load_first_names()
+    last_choices, last_cum = _load_last_names()
+
+    first = random.choices(first_choices, cum_weights=first_cum, k=1)[0]
+    last = random.choices(last_choices, cum_weights=last_cum, k=1)[0]
+
     return f"{first} {last}"
 
 
@@ -141,41 +153,63 @@ def generate_email(name: str, domain: str) -> str:
 
 
 def generate_unique_names(count: int) -> List[str]:
-    """Generate a list of unique full names."""
+    """Generate a list of unique full names.
+
+    Draws first and last names in oversampled batches (one
+    random.choices call per component per round) and dedupes with a
+    set, instead of paying the per-call distribution setup of
+    generate_full_name for every candidate.
+    """
+    first_choices, first_cum = _load_first_names()
+    last_choices, last_cum = _load_last_names()
+
     names = set()
     attempts = 0
     max_attempts = count * 3  # Avoid infinite loop
-    
+
     while len(names) < count and attempts < max_attempts:
-        names.add(generate_full_name())
-        attempts += 1
-    
+        need = count - len(names)
+        k = min(need * 2, max_attempts - attempts)  # Oversample for collisions
+        firsts = random.choices(first_choices, cum_weights=first_cum, k=k)
+        lasts = random.choices(last_choices, cum_weights=last_cum, k=k)
+        names.update(f"{f} {l}" for f, l in zip(firsts, lasts))
+        attempts += k
+
     # If we couldn't get enough unique names, add numbered variants
     while len(names) < count:
         base_name = generate_full_name()
         suffix = random.randint(1, 99)
         names.add(f"{base_name} {suffix}")
-    
-    return list(names)
+
+    # Trim any oversampling overshoot
+    result = list(names)
+    return result[:count]
 
 
 def generate_unique_emails(names: List[str], domain: str) -> List[str]:
     """Generate unique emails for a list of names."""
     emails = []
     seen = set()
-    
+    # Duplicates per base email, so the k-th duplicate starts its suffix
+    # probe at k instead of rescanning 1..k against the seen set
+    dup_counts = {}
+
     for name in names:
         base_email = generate_email(name, domain)
-        email = base_email
-        counter = 1
-        
-        while email in seen:
-            # Add number to make unique
+        counter = dup_counts.get(base_email, 0)
+
+        if counter == 0 and base_email not in seen:
+            email = base_email
+        else:
             local, dom = base_email.split('@')
             email = f"{local}{counter}@{dom}"
-            counter += 1
-        
+            while email in seen:
+                # Suffix collided with another name's base email
+                counter += 1
+                email = f"{local}{counter}@{dom}"
+
+        dup_counts[base_email] = counter + 1
         emails.append(email)
         seen.add(email)
-    
+
     return emails